@@ -1,47 +1,134 @@
 #!/usr/bin/env python3
 import time
+import heapq
 import json
-import subprocess
+import msgspec
 import psutil
-from collections import defaultdict
+import struct
+from collections import deque
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 import sys
 from datetime import datetime, timedelta
 import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('AppIndicator3', '0.1')
 from gi.repository import Gtk, AppIndicator3, GLib
+import Xlib.display
+from Xlib import X
 
 class AppUsageTracker:
-    def __init__(self, interval=1, data_file="~/.app_usage_tracker.json", settings_file="~/.app_usage_tracker_settings.json"):
-        self.interval = interval
+    # Rewrite the snapshot and truncate the log once this many frames pile up.
+    COMPACT_THRESHOLD = 4096
+    # Cap summaries at the rows anyone actually scrolls through.
+    SUMMARY_TOP_K = 50
+
+    def __init__(self, data_file="~/.app_usage_tracker.msgpack", settings_file="~/.app_usage_tracker_settings.json"):
         self.data_file = os.path.expanduser(data_file)
+        self.log_file = self.data_file + '.log'
         self.settings_file = os.path.expanduser(settings_file)
-        self.usage_data = defaultdict(lambda: defaultdict(float))
+        # Flat accumulator keyed by (date, app): one hash lookup per increment.
+        self.usage_data = {}
+        self._pending_deltas = []
+        # Handoff queue: the X event callback appends (date, app, seconds)
+        # and the consumers drain it into usage_data before reading.
+        self._events = deque()
+        # (rollover_ts, date_str, day_name) -- strftime only runs at midnight.
+        self._date_cache = (0.0, '', '')
         self.last_app = None
         self.last_time = time.time()
         self.running = False
-        self.track_thread = None
+        self._x_watch = None
+        self._display = Xlib.display.Display()
+        self._root_win = self._display.screen().root
+        self.NET_ACTIVE_WINDOW = self._display.intern_atom('_NET_ACTIVE_WINDOW')
+        self.NET_WM_PID = self._display.intern_atom('_NET_WM_PID')
+        self.NET_WM_NAME = self._display.intern_atom('_NET_WM_NAME')
+        # (pid, name) of the last foreground process; single-entry so a
+        # reused pid can never be reported with a dead process's name.
+        self._pid_cache = (None, "Unknown")
+        # Ask for PropertyNotify on the root window so the tracker can sleep
+        # until the window manager actually changes _NET_ACTIVE_WINDOW.
+        self._root_win.change_attributes(event_mask=X.PropertyChangeMask)
+        self._display.flush()
         os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
         os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
         self.load_data()
         self.load_settings()
 
+    def _today(self):
+        """Return (rollover_ts, 'YYYY-MM-DD', day name), recomputed only at midnight."""
+        if time.time() >= self._date_cache[0]:
+            now = datetime.now()
+            midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            self._date_cache = (midnight.timestamp(), now.strftime('%Y-%m-%d'), now.strftime('%A'))
+        return self._date_cache
+
     def load_data(self):
+        data = None
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    for date, apps in data.items():
-                        if date not in self.usage_data:
-                            date_obj = datetime.strptime(date, '%Y-%m-%d')
-                            if datetime.now() - date_obj <= timedelta(days=7):
-                                self.usage_data[date].update(apps)
-            except (json.JSONDecodeError, IOError, ValueError):
+                with open(self.data_file, 'rb') as f:
+                    data = msgspec.msgpack.decode(f.read(), type=dict[str, dict[str, float]])
+            except (msgspec.DecodeError, IOError):
                 pass
+        else:
+            # One-shot migration from the old indented-JSON format.
+            legacy_file = os.path.splitext(self.data_file)[0] + '.json'
+            if os.path.exists(legacy_file):
+                try:
+                    with open(legacy_file, 'r') as f:
+                        data = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    pass
+        if data:
+            # ISO dates compare correctly as strings, so a precomputed cutoff
+            # avoids strptime on every key.
+            cutoff = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            for date, apps in data.items():
+                if date >= cutoff:
+                    for app, seconds in apps.items():
+                        self.usage_data[(date, app)] = seconds
+        if self._replay_log() > self.COMPACT_THRESHOLD:
+            self.compact()
+
+    def _replay_log(self):
+        """Apply the append-only delta log on top of the loaded snapshot."""
+        if not os.path.exists(self.log_file):
+            return 0
+        events = []
+        header = struct.Struct('>I')
+        try:
+            with open(self.log_file, 'rb') as f:
+                buf = f.read()
+            offset = 0
+            decode = msgspec.msgpack.decode
+            frame_type = tuple[str, str, float]
+            while offset + header.size <= len(buf):
+                (length,) = header.unpack_from(buf, offset)
+                offset += header.size
+                if offset + length > len(buf):
+                    break  # truncated trailing frame from an interrupted write
+                events.append(decode(buf[offset:offset + length], type=frame_type))
+                offset += length
+        except (msgspec.DecodeError, IOError):
+            pass
+        self._accumulate(events)
+        return len(events)
+
+    def _accumulate(self, events):
+        """Batch-fold decoded (date, app, seconds) events into usage_data.
+
+        Hot when replaying thousands of log frames: locals and interned key
+        strings keep the per-event cost to one hash probe and one add.
+        """
+        usage = self.usage_data
+        get = usage.get
+        intern = sys.intern
+        for date, app, seconds in events:
+            key = (intern(date), intern(app))
+            usage[key] = get(key, 0.0) + seconds
 
     def load_settings(self):
         if os.path.exists(self.settings_file):
@@ -70,83 +157,167 @@ class AppUsageTracker:
 
     def get_active_window_process(self):
         try:
-            window_id = subprocess.check_output(['xdotool', 'getactivewindow'],
-                                                 stderr=subprocess.DEVNULL, timeout=1).decode().strip()
-            if not window_id or window_id == '0':
+            active = self._root_win.get_full_property(self.NET_ACTIVE_WINDOW, X.AnyPropertyType)
+            if not active or not active.value or active.value[0] == 0:
                 return "Unknown"
+            window = self._display.create_resource_object('window', active.value[0])
 
-            pid = subprocess.check_output(['xdotool', 'getwindowpid', window_id],
-                                          stderr=subprocess.DEVNULL, timeout=1).decode().strip()
             process_name = "Unknown"
-            if pid and pid != '0':
-                process = psutil.Process(int(pid))
-                process_name = process.name().lower()
-
-            window_name = subprocess.check_output(['xdotool', 'getwindowname', window_id],
-                                                  stderr=subprocess.DEVNULL, timeout=1).decode().strip()
-
-            app_id = f"{window_name} [{process_name}]"
-            return app_id if window_name else process_name
+            pid_prop = window.get_full_property(self.NET_WM_PID, X.AnyPropertyType)
+            if pid_prop and pid_prop.value:
+                pid = int(pid_prop.value[0])
+                cached_pid, cached_name = self._pid_cache
+                if pid == cached_pid:
+                    process_name = cached_name
+                else:
+                    process_name = psutil.Process(pid).name().lower()
+                    self._pid_cache = (pid, process_name)
+
+            window_name = ""
+            name_prop = window.get_full_property(self.NET_WM_NAME, X.AnyPropertyType)
+            if name_prop and name_prop.value:
+                value = name_prop.value
+                window_name = value.decode('utf-8', 'replace') if isinstance(value, bytes) else str(value)
+            window_name = window_name.strip()
+
+            # Intern the id: the same window produces the same object every
+            # time, so dict keys dedupe and comparisons are identity checks.
+            app_id = f"{window_name} [{process_name}]" if window_name else process_name
+            return sys.intern(app_id)
         except Exception:
             return "Unknown"
 
-    def track_usage(self):
-        while self.running:
-            current_app = self.get_active_window_process()
-            current_time = time.time()
-            current_date = datetime.now().strftime('%Y-%m-%d')
-
-            if self.last_app is not None:
-                time_diff = current_time - self.last_time
-                self.usage_data[current_date][self.last_app] += time_diff
-
-            self.last_app = current_app
-            self.last_time = current_time
-            time.sleep(self.interval)
+    def _on_x_event(self, fd, condition):
+        """GLib watch on the X connection: record time at app switches."""
+        if not self.running:
+            return GLib.SOURCE_REMOVE
+
+        # The get_full_property round-trips below can pull fresh events into
+        # Xlib's client-side queue, where they no longer make the socket
+        # readable (and so never re-fire this watch); keep draining until
+        # the queue is empty on return.
+        while self._display.pending_events():
+            switched = False
+            while self._display.pending_events():
+                event = self._display.next_event()
+                if event.type == X.PropertyNotify and event.atom == self.NET_ACTIVE_WINDOW:
+                    switched = True
+            if switched:
+                current_app = self.get_active_window_process()
+                if current_app is not self.last_app:
+                    current_time = time.time()
+                    if self.last_app is not None:
+                        self._events.append((self._today()[1], self.last_app, current_time - self.last_time))
+                    self.last_app = current_app
+                    self.last_time = current_time
+        return GLib.SOURCE_CONTINUE
 
     def start_tracking(self):
         if not self.running:
             self.running = True
-            self.track_thread = threading.Thread(target=self.track_usage, daemon=True)
-            self.track_thread.start()
+            self.last_app = self.get_active_window_process()
+            self.last_time = time.time()
+            self._x_watch = GLib.io_add_watch(self._display.fileno(), GLib.IO_IN, self._on_x_event)
 
     def stop_tracking(self):
         self.running = False
-        if self.track_thread:
-            self.track_thread.join()
+        if self._x_watch is not None:
+            GLib.source_remove(self._x_watch)
+            self._x_watch = None
         self.save_data()
+        self.compact()
+
+    def _drain_events(self):
+        """Fold queued tracker events into usage_data (consumer side)."""
+        events = self._events
+        while events:
+            date, app, time_diff = events.popleft()
+            key = (date, app)
+            self.usage_data[key] = self.usage_data.get(key, 0.0) + time_diff
+            self._pending_deltas.append((date, app, time_diff))
 
     def save_data(self):
+        """Append pending deltas to the log; the snapshot is left untouched."""
         try:
+            self._drain_events()
             if self.last_app:
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                self.usage_data[current_date][self.last_app] += time.time() - self.last_time
-            with open(self.data_file, 'w') as f:
-                current_date_obj = datetime.now()
-                filtered_data = {
-                    date: dict(apps) for date, apps in self.usage_data.items()
-                    if (current_date_obj - datetime.strptime(date, '%Y-%m-%d')).days <= 7
-                }
-                json.dump(filtered_data, f, indent=2)
+                current_time = time.time()
+                current_date = self._today()[1]
+                time_diff = current_time - self.last_time
+                key = (current_date, self.last_app)
+                self.usage_data[key] = self.usage_data.get(key, 0.0) + time_diff
+                self._pending_deltas.append((current_date, self.last_app, time_diff))
+                self.last_time = current_time
+            if self._pending_deltas:
+                with open(self.log_file, 'ab') as f:
+                    for delta in self._pending_deltas:
+                        frame = msgspec.msgpack.encode(delta)
+                        f.write(struct.pack('>I', len(frame)) + frame)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._pending_deltas.clear()
             return True
         except Exception:
             return False
 
-    def delete_date(self, date):
-        if date in self.usage_data:
-            del self.usage_data[date]
-            self.save_data()
+    def compact(self):
+        """Rewrite the full snapshot and truncate the delta log.
+
+        The snapshot is written to a temp file and atomically renamed over
+        the old one before the log is truncated, so a crash at any point
+        leaves either the old snapshot + full log or the new snapshot.
+        """
+        try:
+            cutoff = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            filtered_data = {}
+            for (date, app), seconds in self.usage_data.items():
+                if date >= cutoff:
+                    filtered_data.setdefault(date, {})[app] = seconds
+            tmp_file = self.data_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(msgspec.msgpack.encode(filtered_data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
+            open(self.log_file, 'wb').close()
+            # Everything pending is already folded into usage_data and thus
+            # in the new snapshot; re-logging it later would double-count.
+            self._pending_deltas.clear()
             return True
-        return False
+        except Exception:
+            return False
+
+    def delete_date(self, date):
+        self._drain_events()
+        keys = [key for key in self.usage_data if key[0] == date]
+        if not keys:
+            return False
+        for key in keys:
+            del self.usage_data[key]
+        self.compact()
+        return True
+
+    def get_dates(self):
+        self._drain_events()
+        return sorted({date for date, _ in self.usage_data}, reverse=True)
 
     def get_summary(self, date=None):
-        if date:
-            apps = self.usage_data.get(date, {})
-        else:
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            apps = self.usage_data[current_date]
+        self._drain_events()
+        if not date:
+            date = self._today()[1]
+        apps = {app: seconds for (d, app), seconds in self.usage_data.items() if d == date}
+        if self.running and self.last_app is not None and date == self._today()[1]:
+            # Accumulation only happens at app switches; fold the open
+            # interval for the foreground app in read-only so today's view
+            # keeps ticking between switches.
+            apps[self.last_app] = apps.get(self.last_app, 0.0) + (time.time() - self.last_time)
         total_time = sum(apps.values()) or 1
-        sorted_apps = sorted(apps.items(), key=lambda x: x[1], reverse=True)
+        if len(apps) > self.SUMMARY_TOP_K:
+            # Only the top rows are worth showing; a K-sized heap beats
+            # sorting the whole dict every refresh.
+            sorted_apps = heapq.nlargest(self.SUMMARY_TOP_K, apps.items(), key=lambda x: x[1])
+        else:
+            sorted_apps = sorted(apps.items(), key=lambda x: x[1], reverse=True)
         return sorted_apps, total_time
 
 class AppUsageGUI:
@@ -158,6 +329,16 @@ class AppUsageGUI:
         self.sort_column = None
         self.sort_reverse = False
         self.indicator = None
+        # Diff state for the Applications view so refreshes touch only
+        # rows that actually changed.
+        self._row_iids = {}
+        self._row_values = {}
+        self._row_order = []
+        self._apps_dirty = True
+        self._last_total = None
+        # app -> (whole seconds, formatted string); the string only changes
+        # once a second and never for apps that aren't in the foreground.
+        self._fmt_cache = {}
 
         self.setup_ui()
         self.tracker.start_tracking()
@@ -194,13 +375,13 @@ class AppUsageGUI:
         tk.Label(self.history_panel, text="Select Date:", bg="#2c2f33", fg="white", font=("Helvetica", 14)).pack(pady=5)
         
         # Get unique dates from data, sorted newest first
-        dates = sorted(list(self.tracker.usage_data.keys()), reverse=True)
+        dates = self.tracker.get_dates()
         
         self.selected_date = tk.StringVar()
 
         if not dates:
             # If there's no data at all, just use today's date
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = self.tracker._today()[1]
             dates.append(today)
             self.selected_date.set(today)
         else:
@@ -216,7 +397,9 @@ class AppUsageGUI:
         tk.Button(self.history_panel, text="Delete Date", command=self.delete_date).pack(pady=5)
         # --- END OF MODIFICATION ---
 
-        self.tree = ttk.Treeview(self.content, columns=('time', 'percentage'), selectmode='browse')
+        # 'secs' holds the raw seconds for numeric sorting and stays hidden.
+        self.tree = ttk.Treeview(self.content, columns=('time', 'percentage', 'secs'),
+                                 displaycolumns=('time', 'percentage'), selectmode='browse')
         self.tree.heading('#0', text='Application', command=lambda: self.sort_tree('#0'))
         self.tree.heading('time', text='Time Spent', command=lambda: self.sort_tree('time'))
         self.tree.heading('percentage', text='Percentage', command=lambda: self.sort_tree('percentage'))
@@ -225,7 +408,8 @@ class AppUsageGUI:
         self.tree.column('percentage', width=100, anchor='e')
         self.tree.pack(fill="both", expand=True)
 
-        self.date_label = tk.Label(self.content, text=f"Date: {datetime.now().strftime('%Y-%m-%d')}, Day: {datetime.now().strftime('%A')}",
+        _, today_str, day_name = self.tracker._today()
+        self.date_label = tk.Label(self.content, text=f"Date: {today_str}, Day: {day_name}",
                                    bg="#2c2f33", fg="white", font=("Helvetica", 12))
         self.date_label.pack(anchor='w', pady=5, padx=10)
 
@@ -259,6 +443,10 @@ class AppUsageGUI:
 
     def restore_window(self, source):
         def _restore():
+            # Redraw from scratch on the next tick; refreshes were skipped
+            # while the window was withdrawn.
+            self._apps_dirty = True
+            self._last_total = None
             self.root.deiconify()
             self.root.lift()
             self.root.focus_force()
@@ -278,7 +466,7 @@ class AppUsageGUI:
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete all data for {date_to_delete}?"):
             if self.tracker.delete_date(date_to_delete):
                 # Re-fetch the list of dates from the tracker data
-                dates = sorted(list(self.tracker.usage_data.keys()), reverse=True)
+                dates = self.tracker.get_dates()
                 
                 # Clear the old menu
                 menu = self.date_menu['menu']
@@ -286,7 +474,7 @@ class AppUsageGUI:
 
                 if not dates:
                     # If all dates were deleted, add today's date as a placeholder
-                    today = datetime.now().strftime('%Y-%m-%d')
+                    today = self.tracker._today()[1]
                     menu.add_command(label=today, command=lambda d=today: self.selected_date.set(d))
                     self.selected_date.set(today)
                     self.update_history(today) # Update view to show empty state
@@ -311,35 +499,23 @@ class AppUsageGUI:
 
         if column == '#0':
             items = [(self.tree.item(child, 'text'), child) for child in self.tree.get_children('')]
+        elif column == 'time':
+            # Sort on the hidden raw-seconds column instead of parsing the
+            # "Xh XXm XXs" string we formatted ourselves.
+            items = [(float(self.tree.set(child, 'secs')), child) for child in self.tree.get_children('')]
         else:
             items = [(self.tree.set(child, column), child) for child in self.tree.get_children('')]
 
         if column == '#0':
             items.sort(key=lambda x: x[0].lower(), reverse=self.sort_reverse)
         elif column == 'time':
-            items.sort(key=lambda x: self.parse_time(x[0]), reverse=not self.sort_reverse)
+            items.sort(key=lambda x: x[0], reverse=not self.sort_reverse)
         elif column == 'percentage':
             items.sort(key=lambda x: float(x[0].rstrip('%')), reverse=not self.sort_reverse)
 
         for index, (val, child) in enumerate(items):
             self.tree.move(child, '', index)
 
-    def parse_time(self, time_str):
-        hours = 0
-        minutes = 0
-        seconds = 0
-
-        parts = time_str.split()
-        for part in parts:
-            if 'h' in part:
-                hours = int(part.replace('h', ''))
-            elif 'm' in part:
-                minutes = int(part.replace('m', ''))
-            elif 's' in part:
-                seconds = int(part.replace('s', ''))
-
-        return hours * 3600 + minutes * 60 + seconds
-
     def toggle_theme(self):
         if self.tracker.dark_mode.get():
             bg = "#2c2f33"
@@ -396,50 +572,92 @@ class AppUsageGUI:
 
     def update_history(self, date):
         sorted_apps, total_time = self.tracker.get_summary(date)
-        for item in self.tree.get_children():
+        for item in self.tree.get_children(''):
             self.tree.delete(item)
         for app, seconds in sorted_apps:
-            hours, rem = divmod(seconds, 3600)
-            minutes, secs = divmod(rem, 60)
-            time_str = f"{int(hours)}h {int(minutes):02d}m {int(secs):02d}s"
+            time_str = self._format_time(app, seconds)
             pct = (seconds / total_time) * 100
-            self.tree.insert('', 'end', text=app, values=(time_str, f"{pct:.1f}%"))
+            self.tree.insert('', 'end', text=app, values=(time_str, f"{pct:.1f}%", seconds))
         self.total_label.config(text=f"Total tracked time: {total_time / 3600:.2f} hours")
+        # The tree now holds history rows; force a full rebuild next time
+        # the Applications view refreshes.
+        self._apps_dirty = True
+        self._last_total = None
 
     def update_display(self):
+        # Tracking continues in the background; skip the widget work while
+        # the window is hidden in the tray or another view is showing.
+        if self.root.state() == 'withdrawn' or self.current_view != "Applications":
+            self.root.after(self.update_interval, self.update_display)
+            return
         if self.tracker.running and self.tracker.auto_refresh.get():
-            if self.current_view == "Applications":
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                self.date_label.config(text=f"Date: {current_date}, Day: {datetime.now().strftime('%A')}")
-                sorted_apps, total_time = self.tracker.get_summary(current_date)
-                for item in self.tree.get_children():
-                    self.tree.delete(item)
-                total_seconds = sum(s for _, s in sorted_apps) or 1
-                for app, seconds in sorted_apps:
-                    hours, rem = divmod(seconds, 3600)
-                    minutes, secs = divmod(rem, 60)
-                    time_str = f"{int(hours)}h {int(minutes):02d}m {int(secs):02d}s"
-                    pct = (seconds / total_seconds) * 100
-                    self.tree.insert('', 'end', text=app, values=(time_str, f"{pct:.1f}%"))
-                self.total_label.config(text=f"Total tracked time: {total_seconds / 3600:.2f} hours")
+            _, current_date, day_name = self.tracker._today()
+            self.date_label.config(text=f"Date: {current_date}, Day: {day_name}")
+            sorted_apps, total_time = self.tracker.get_summary(current_date)
+            if self._apps_dirty or total_time != self._last_total:
+                self._refresh_tree(sorted_apps, total_time)
+                self._last_total = total_time
+                self.total_label.config(text=f"Total tracked time: {total_time / 3600:.2f} hours")
         self.root.after(self.update_interval, self.update_display)
 
+    def _format_time(self, app, seconds):
+        """Format seconds as 'Xh XXm XXs', reusing the cached string while
+        the whole-second value for this app is unchanged."""
+        sec_i = int(seconds)
+        cached = self._fmt_cache.get(app)
+        if cached is not None and cached[0] == sec_i:
+            return cached[1]
+        time_str = "%dh %02dm %02ds" % (sec_i // 3600, sec_i % 3600 // 60, sec_i % 60)
+        self._fmt_cache[app] = (sec_i, time_str)
+        return time_str
+
+    def _refresh_tree(self, sorted_apps, total_seconds):
+        """Diff the Applications rows against the tree instead of rebuilding it."""
+        if self._apps_dirty:
+            for item in self.tree.get_children(''):
+                self.tree.delete(item)
+            self._row_iids.clear()
+            self._row_values.clear()
+            self._row_order = []
+            self._apps_dirty = False
+
+        new_apps = {app for app, _ in sorted_apps}
+        for app in list(self._row_iids):
+            if app not in new_apps:
+                self.tree.delete(self._row_iids.pop(app))
+                self._row_values.pop(app, None)
+
+        for app, seconds in sorted_apps:
+            time_str = self._format_time(app, seconds)
+            pct = (seconds / total_seconds) * 100
+            values = (time_str, f"{pct:.1f}%", seconds)
+            iid = self._row_iids.get(app)
+            if iid is None:
+                self._row_iids[app] = self.tree.insert('', 'end', text=app, values=values)
+                self._row_values[app] = values
+            elif self._row_values[app] != values:
+                self.tree.item(iid, values=values)
+                self._row_values[app] = values
+
+        order = [app for app, _ in sorted_apps]
+        if order != self._row_order:
+            for index, app in enumerate(order):
+                self.tree.move(self._row_iids[app], '', index)
+            self._row_order = order
+
     def on_close(self):
         self.root.withdraw()
         self.indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
 
 def check_dependencies():
-    try:
-        subprocess.run(['xdotool', '--version'],
-                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except Exception:
-        return False
+    # Tracking talks to X directly via python-xlib now; an X display is the
+    # only hard external dependency left.
+    return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
 
 def main():
     if not check_dependencies():
-        print("Error: xdotool is not installed. Please install it with:")
-        print("sudo apt install xdotool")
+        print("Error: no X display found. This tracker needs a running X session")
+        print("(or XWayland) to watch the active window.")
         sys.exit(1)
 
     root = tk.Tk()